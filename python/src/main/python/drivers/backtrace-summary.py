@@ -16,9 +16,14 @@
 
 import argparse
 import os
+import re
 import sys
 from typing import List, Dict, Tuple, Any
 
+# A line mentioning 'backtrace', followed by two lines that each contain '#'.  The groups capture the
+# two following lines from their first '#' onwards.
+BACKTRACE_PATTERN = re.compile(r'^.*backtrace.*\n[^#\n]*(#.*)\n[^#\n]*(#.*)$', re.MULTILINE)
+
 
 def get_result_files(arg: str) -> List[str]:
     for root, folders, files in os.walk(arg):
@@ -49,21 +54,24 @@ def main_helper(args: List[str]) -> None:
     mapping = {}  # type: Dict[str, Tuple[int, str]]
 
     for to_check in files_to_check:
-        if 'CRASH' in open(to_check, 'r').read():
-            text_file = os.path.splitext(os.path.splitext(to_check)[0])[0] + '.txt'
-            lines = open(text_file, 'r').readlines()
-            for i in range(0, len(lines) - 2):
-                if 'backtrace' in lines[i] and '#' in lines[i + 1] and '#' in lines[i + 2]:
-                    crash_string = (
-                        '      ' + lines[i + 1][lines[i + 1].index('#'):]
-                        + '      ' + lines[i + 2][lines[i + 2].index('#'):]
-                    ).rstrip()
-                    if crash_string not in mapping:
-                        mapping[crash_string] = (1, text_file)
-                    else:
-                        existing_entry = mapping[crash_string]
-                        mapping[crash_string] = (existing_entry[0] + 1, existing_entry[1])
-                    break
+        with open(to_check, 'r') as f:
+            if 'CRASH' not in f.read():
+                continue
+        text_file = os.path.splitext(os.path.splitext(to_check)[0])[0] + '.txt'
+        with open(text_file, 'r') as f:
+            # Scan the whole log in one pass rather than splitting it into lines first.
+            match = BACKTRACE_PATTERN.search(f.read())
+        if match is None:
+            continue
+        crash_string = (
+            '      ' + match.group(1) + '\n'
+            + '      ' + match.group(2)
+        ).rstrip()
+        if crash_string not in mapping:
+            mapping[crash_string] = (1, text_file)
+        else:
+            existing_entry = mapping[crash_string]
+            mapping[crash_string] = (existing_entry[0] + 1, existing_entry[1])
 
     print('Distinct crash string(s) found: ' + str(len(mapping)) + '\n')
 
@@ -134,8 +134,8 @@ MAX_OPT_ARGS = 30
 def random_spirvopt_args() -> List[str]:
     result = []
     num_args = random.randint(0, MAX_OPT_ARGS)
-    for i in range(0, num_args):
-        arg = OPT_OPTIONS[random.randint(0, len(OPT_OPTIONS) - 1)]
+    for _ in range(num_args):
+        arg = random.choice(OPT_OPTIONS)
         # --merge-return relies on there not being unreachable code, so we always invoke dead branch
         # elimination before --merge-return.
         if arg == '--merge-return':
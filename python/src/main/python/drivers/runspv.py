@@ -1350,35 +1350,25 @@ def run_compute_amber(
 # Main
 
 
-def some_shader_format_exists(prefix: str, kind: str) -> bool:
-    return (
-        os.path.isfile(prefix + '.' + kind)
-        or os.path.isfile(prefix + '.' + kind + '.asm')
-        or os.path.isfile(prefix + '.' + kind + '.spv')
-    )
-
-
-def multiple_shader_formats_exist(prefix: str, kind: str) -> bool:
-    count = 0
-    if os.path.isfile(prefix + '.' + kind):
-        count += 1
-    if os.path.isfile(prefix + '.' + kind + '.asm'):
-        count += 1
-    if os.path.isfile(prefix + '.' + kind + '.spv'):
-        count += 1
-    return count > 1
+def get_existing_shader_formats(prefix: str, kind: str) -> List[str]:
+    """
+    Returns the shader files of the given kind that exist for the prefix, in order of preference:
+    prefix.kind, prefix.kind.asm, prefix.kind.spv.  Each candidate is checked only once.
+    """
+    candidates = [
+        prefix + '.' + kind,
+        prefix + '.' + kind + '.asm',
+        prefix + '.' + kind + '.spv',
+    ]
+    return [candidate for candidate in candidates if os.path.isfile(candidate)]
 
 
-def pick_shader_format(prefix: str, kind: str) -> str:
-    if multiple_shader_formats_exist(prefix, kind):
+def pick_shader_format(existing_formats: List[str], kind: str) -> str:
+    if len(existing_formats) > 1:
         raise ValueError(
             'More than one of .' + kind + ', .' + kind + '.asm and .' + kind + '.spv are present')
-    if os.path.isfile(prefix + '.' + kind):
-        return prefix + '.' + kind
-    if os.path.isfile(prefix + '.' + kind + '.asm'):
-        return prefix + '.' + kind + '.asm'
-    assert os.path.isfile(prefix + '.' + kind + '.spv')
-    return prefix + '.' + kind + '.spv'
+    assert len(existing_formats) == 1
+    return existing_formats[0]
 
 
 def main_helper(args):
@@ -1432,23 +1422,25 @@ def main_helper(args):
     # If the JSON argument is foo.json the prefix will be foo.
     shader_prefix = os.path.splitext(args.json)[0]
 
+    # Find which shader files are present; each candidate file is checked only once.
+    comp_formats = get_existing_shader_formats(shader_prefix, 'comp')
+    vert_formats = get_existing_shader_formats(shader_prefix, 'vert')
+    frag_formats = get_existing_shader_formats(shader_prefix, 'frag')
+
     # If a compute shader is present...
-    if some_shader_format_exists(shader_prefix, 'comp'):
-        if (
-            some_shader_format_exists(shader_prefix, 'vert')
-            or some_shader_format_exists(shader_prefix, 'frag')
-        ):
+    if comp_formats:
+        if vert_formats or frag_formats:
             raise ValueError('Compute shader cannot coexist with vertex/fragment shaders')
-        compute_shader_file = pick_shader_format(shader_prefix, 'comp')
+        compute_shader_file = pick_shader_format(comp_formats, 'comp')
         vertex_shader_file = None
         fragment_shader_file = None
-    elif some_shader_format_exists(shader_prefix, 'vert'):
-        if not some_shader_format_exists(shader_prefix, 'frag'):
+    elif vert_formats:
+        if not frag_formats:
             raise ValueError('Vertex shader but no fragment shader found')
         compute_shader_file = None
-        vertex_shader_file = pick_shader_format(shader_prefix, 'vert')
-        fragment_shader_file = pick_shader_format(shader_prefix, 'frag')
-    elif some_shader_format_exists(shader_prefix, 'frag'):
+        vertex_shader_file = pick_shader_format(vert_formats, 'vert')
+        fragment_shader_file = pick_shader_format(frag_formats, 'frag')
+    elif frag_formats:
         if args.legacy_worker:
             raise ValueError(
                 'Fragment shader requires accompanying vertex shader when legacy worker is used'
@@ -1456,7 +1448,7 @@ def main_helper(args):
         # Because Amber has a pass through option, we can do without a vertex shader
         compute_shader_file = None
         vertex_shader_file = None
-        fragment_shader_file = pick_shader_format(shader_prefix, 'frag')
+        fragment_shader_file = pick_shader_format(frag_formats, 'frag')
     else:
         raise ValueError('No shader files found')
 